@@ -1,22 +1,100 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import atexit
+import copy
 import json
+import os
+import random
 import time
+from time import perf_counter
 import logging
-from datetime import datetime
-from typing import Dict, List, Any
+import logging.handlers
+import queue
+from collections import Counter
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field, asdict
 import subprocess
 import socket
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
+try:
+    import orjson  # optional fast JSON encoder for reports
+except ImportError:
+    orjson = None
+
+try:
+    import httpx  # optional async HTTP client for run_test_suite_async
+except ImportError:
+    httpx = None
+
+# Configure logging: records are queued on the calling thread and written
+# to file/console by a background QueueListener. Like basicConfig, this is
+# skipped when the host application has already configured logging.
+_log_queue = queue.Queue(-1)
+_root_logger = logging.getLogger()
+if not _root_logger.handlers:
+    _log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    _log_handlers = [
         logging.FileHandler('test_automation.log'),
         logging.StreamHandler()
     ]
-)
+    for _handler in _log_handlers:
+        _handler.setFormatter(_log_formatter)
+    
+    _root_logger.setLevel(logging.WARNING)
+    _root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    
+    _log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+    _log_listener.start()
+    # Drain queued records before logging's own shutdown closes the handlers
+    atexit.register(_log_listener.stop)
+
+def _flush_logs():
+    """Block until every queued log record has been written"""
+    _log_queue.join()
+
+@dataclass(slots=True)
+class TestResult:
+    """Outcome of a single device test"""
+    test_name: str
+    device: str
+    status: str
+    error: Optional[str] = None
+    duration: float = 0.0
+    timestamp: str = ''
+    extra: Dict[str, Any] = field(default_factory=dict)  # test-specific data
+    
+    def to_dict(self):
+        """Flatten into the report's JSON shape, with extra data inlined"""
+        data = asdict(self)
+        data.update(data.pop('extra'))
+        return data
+
+# (whole second, formatted string); swapped as one tuple so threads never
+# see a half-updated pair
+_now_iso_cache = (None, '')
+
+def _now_iso():
+    """Current UTC time as an ISO-8601 string, formatted at most once per second"""
+    global _now_iso_cache
+    second = int(time.time())
+    cached_second, formatted = _now_iso_cache
+    if second != cached_second:
+        formatted = datetime.fromtimestamp(second, timezone.utc).isoformat().replace('+00:00', 'Z')
+        _now_iso_cache = (second, formatted)
+    return formatted
+
+@lru_cache(maxsize=8)
+def _parse_config(path, mtime_ns):
+    """Parse a device config file; cached until the file's mtime changes"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 class NetworkDeviceTestFramework:
     """
@@ -24,11 +102,36 @@ class NetworkDeviceTestFramework:
     Simulates Ciena's test automation environment
     """
     
+    # Snapshot sections fetched in one /bulk call, keyed to their REST endpoints
+    SNAPSHOT_ENDPOINTS = {
+        'status': '/system/status',
+        'interfaces': '/interfaces',
+        'alarms': '/alarms'
+    }
+    
+    # Pre-bound RNG functions for the simulation hot paths
+    _uniform = staticmethod(random.uniform)
+    _random = staticmethod(random.random)
+    
     def __init__(self, config_file=None):
+        self._sim_cache = {}  # (device_name, endpoint) -> simulated response
         self.test_results = []
         self.defects = []
         self.device_configs = {}
         self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()  # guards test_results/defects across worker threads
+        self._thread_local = threading.local()  # per-worker result buffers during run_test_suite
+        self._status_counts = Counter()  # running PASSED/FAILED/ERROR tallies
+        
+        # Pooled HTTP session so REST calls reuse keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         # Default device configurations
         self.default_devices = {
@@ -37,14 +140,16 @@ class NetworkDeviceTestFramework:
                 'type': 'optical_transponder',
                 'management_port': 8080,
                 'expected_interfaces': 4,
-                'protocols': ['REST', 'SNMP', 'CLI']
+                'protocols': ['REST', 'SNMP', 'CLI'],
+                'simulate': True
             },
             'microwave_device_1': {
                 'ip': '192.168.1.101', 
                 'type': 'microwave_radio',
                 'management_port': 443,
                 'expected_interfaces': 2,
-                'protocols': ['REST', 'NETCONF']
+                'protocols': ['REST', 'NETCONF'],
+                'simulate': True
             }
         }
         
@@ -53,23 +158,115 @@ class NetworkDeviceTestFramework:
         else:
             self.device_configs = self.default_devices
     
+    @property
+    def device_configs(self):
+        """Device configurations keyed by device name"""
+        return self._device_configs
+    
+    @device_configs.setter
+    def device_configs(self, configs):
+        # Simulated responses are built from these configs, so drop them too
+        self._device_configs = configs
+        self._sim_cache.clear()
+    
+    def close(self):
+        """Release pooled HTTP connections and flush queued log records"""
+        self.session.close()
+        _flush_logs()
+    
+    def _record_result(self, result):
+        """Append a test result (thread-safe)"""
+        buffer = getattr(self._thread_local, 'results', None)
+        if buffer is not None:
+            # Inside a suite worker: buffer locally, merged once the suite finishes
+            buffer.append(result)
+            return
+        self._merge_results([result])
+    
+    def _merge_results(self, results):
+        """Add a batch of test results and update the status tallies"""
+        with self._lock:
+            self.test_results.extend(results)
+            self._status_counts.update(result.status for result in results)
+    
+    def reset_results(self):
+        """Clear recorded test results together with their status tallies"""
+        with self._lock:
+            self.test_results.clear()
+            self._status_counts.clear()
+    
+    def _finalize_result(self, result, start_time):
+        """Stamp a test result with its duration and completion time"""
+        result.duration = perf_counter() - start_time
+        result.timestamp = _now_iso()
+        return result
+    
     def load_config(self, config_file):
         """Load device configurations from file"""
         try:
-            with open(config_file, 'r') as f:
-                self.device_configs = json.load(f)
-            self.logger.info(f"Loaded configuration from {config_file}")
+            mtime_ns = os.stat(config_file).st_mtime_ns
+            # Copy so edits to one framework's configs never leak into the cache
+            self.device_configs = copy.deepcopy(_parse_config(config_file, mtime_ns))
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Loaded configuration from {config_file}")
         except Exception as e:
             self.logger.error(f"Error loading config: {e}")
             self.device_configs = self.default_devices
     
-    def simulate_rest_call(self, device_name, endpoint, method='GET', data=None):
-        """Simulate REST API calls to network devices"""
-        device = self.device_configs.get(device_name)
+    def simulate_rest_call(self, device_name, endpoint, method='GET', data=None, device=None):
+        """Issue REST API calls to network devices (simulated when configured)"""
+        if device is None:
+            device = self.device_configs.get(device_name)
         if not device:
             return {'error': 'Device not found'}
         
-        # Simulate API response based on endpoint
+        if not device.get('simulate'):
+            try:
+                url = self._device_url(device, endpoint)
+                response = self.session.request(method, url, json=data, timeout=(1, 5))
+                response.raise_for_status()
+                return response.json()
+            except (requests.RequestException, ValueError) as e:
+                return {'error': f'REST call failed: {e}'}
+        
+        if endpoint == '/bulk':
+            return {
+                section: self._cached_simulation(device_name, device, section_endpoint)
+                for section, section_endpoint in self.SNAPSHOT_ENDPOINTS.items()
+            }
+        return self._cached_simulation(device_name, device, endpoint)
+    
+    def _cached_simulation(self, device_name, device, endpoint):
+        """Simulated response for an endpoint, built once per device config"""
+        key = (device_name, endpoint)
+        response = self._sim_cache.get(key)
+        if response is None:
+            response = self._sim_cache[key] = self._simulate_response(device, endpoint)
+        # Nested sequences are tuples, so a shallow copy keeps the cache intact
+        return dict(response)
+    
+    async def _rest(self, client, device_name, endpoint, method='GET', data=None, device=None):
+        """Async counterpart of simulate_rest_call using a shared httpx client"""
+        if device is None:
+            device = self.device_configs.get(device_name)
+        if not device or device.get('simulate'):
+            return self.simulate_rest_call(device_name, endpoint, method, data, device=device)
+        
+        try:
+            url = self._device_url(device, endpoint)
+            response = await client.request(method, url, json=data)
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            return {'error': f'REST call failed: {e}'}
+    
+    def _device_url(self, device, endpoint):
+        """Build the management REST URL for a device endpoint"""
+        scheme = 'https' if device['management_port'] == 443 else 'http'
+        return f"{scheme}://{device['ip']}:{device['management_port']}{endpoint}"
+    
+    def _simulate_response(self, device, endpoint):
+        """Build the simulated API response for an endpoint"""
         if endpoint == '/system/status':
             return {
                 'status': 'operational',
@@ -88,31 +285,74 @@ class NetworkDeviceTestFramework:
                     'speed': '10Gbps',
                     'duplex': 'full'
                 })
-            return {'interfaces': interfaces}
+            return {'interfaces': tuple(interfaces)}
         elif endpoint == '/alarms':
             return {
-                'active_alarms': [
-                    {'severity': 'minor', 'message': 'Interface eth3 down', 'timestamp': '2025-09-26T10:30:00Z'}
-                ] if device['expected_interfaces'] > 3 else []
+                'active_alarms': (
+                    {'severity': 'minor', 'message': 'Interface eth3 down', 'timestamp': '2025-09-26T10:30:00Z'},
+                ) if device['expected_interfaces'] > 3 else ()
             }
         else:
             return {'message': 'Endpoint simulated successfully'}
     
-    def test_device_connectivity(self, device_name):
+    def _fetch_device_snapshot(self, device_name, device=None):
+        """Fetch status, interface and alarm data in a single bulk REST call"""
+        try:
+            bulk_data = self.simulate_rest_call(
+                device_name, '/bulk', method='POST',
+                data={'endpoints': list(self.SNAPSHOT_ENDPOINTS.values())},
+                device=device
+            )
+            return self._split_snapshot(bulk_data)
+        except Exception as e:
+            # Hand the failure to each test so it records an ERROR result
+            return {section: e for section in self.SNAPSHOT_ENDPOINTS}
+    
+    async def _fetch_device_snapshot_async(self, client, device_name, device=None):
+        """Async counterpart of _fetch_device_snapshot"""
+        try:
+            bulk_data = await self._rest(
+                client, device_name, '/bulk', method='POST',
+                data={'endpoints': list(self.SNAPSHOT_ENDPOINTS.values())},
+                device=device
+            )
+            return self._split_snapshot(bulk_data)
+        except Exception as e:
+            return {section: e for section in self.SNAPSHOT_ENDPOINTS}
+    
+    def _split_snapshot(self, bulk_data):
+        """Split a /bulk response into its per-test sections"""
+        if not isinstance(bulk_data, dict):
+            raise ValueError(f"Malformed bulk response: {bulk_data!r}")
+        if 'error' in bulk_data:
+            return {section: bulk_data for section in self.SNAPSHOT_ENDPOINTS}
+        return {
+            section: bulk_data.get(section, {'error': f'No {section} data in bulk response'})
+            for section in self.SNAPSHOT_ENDPOINTS
+        }
+    
+    def _snapshot_section(self, snapshot, section):
+        """Return a snapshot section, re-raising any failure captured while fetching it"""
+        data = snapshot[section]
+        if isinstance(data, Exception):
+            raise data
+        return data
+    
+    def test_device_connectivity(self, device_name, device=None):
         """Test basic connectivity to network device"""
         test_name = f"connectivity_test_{device_name}"
-        start_time = time.time()
+        start_time = perf_counter()
         
-        device = self.device_configs.get(device_name)
+        if device is None:
+            device = self.device_configs.get(device_name)
         if not device:
-            result = {
-                'test_name': test_name,
-                'status': 'FAILED',
-                'error': 'Device configuration not found',
-                'duration': 0,
-                'timestamp': datetime.now().isoformat()
-            }
-            self.test_results.append(result)
+            result = self._finalize_result(TestResult(
+                test_name=test_name,
+                device=device_name,
+                status='FAILED',
+                error='Device configuration not found'
+            ), start_time)
+            self._record_result(result)
             return result
         
         try:
@@ -130,40 +370,43 @@ class NetworkDeviceTestFramework:
                 error = 'Connectivity failed - device unreachable'
                 self.create_defect(device_name, 'connectivity', error)
             
-            result = {
-                'test_name': test_name,
-                'device': device_name,
-                'status': status,
-                'response_time_ms': response_time,
-                'port_accessible': port_open,
-                'error': error,
-                'duration': time.time() - start_time,
-                'timestamp': datetime.now().isoformat()
-            }
+            result = self._finalize_result(TestResult(
+                test_name=test_name,
+                device=device_name,
+                status=status,
+                error=error,
+                extra={
+                    'response_time_ms': response_time,
+                    'port_accessible': port_open
+                }
+            ), start_time)
             
-            self.test_results.append(result)
-            self.logger.info(f"Connectivity test for {device_name}: {status}")
+            self._record_result(result)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Connectivity test for {device_name}: {status}")
             return result
             
         except Exception as e:
-            result = {
-                'test_name': test_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'duration': time.time() - start_time,
-                'timestamp': datetime.now().isoformat()
-            }
-            self.test_results.append(result)
+            result = self._finalize_result(TestResult(
+                test_name=test_name,
+                device=device_name,
+                status='ERROR',
+                error=str(e)
+            ), start_time)
+            self._record_result(result)
             return result
     
-    def test_device_status(self, device_name):
+    def test_device_status(self, device_name, snapshot=None):
         """Test device operational status"""
         test_name = f"status_test_{device_name}"
-        start_time = time.time()
+        start_time = perf_counter()
         
         try:
             # Get system status via REST API
-            status_data = self.simulate_rest_call(device_name, '/system/status')
+            if snapshot is not None:
+                status_data = self._snapshot_section(snapshot, 'status')
+            else:
+                status_data = self.simulate_rest_call(device_name, '/system/status')
             
             # Define test criteria
             criteria = {
@@ -195,45 +438,49 @@ class NetworkDeviceTestFramework:
                     test_passed = False
                     issues.append(f"High temperature: {status_data['temperature']}°C")
             
-            result = {
-                'test_name': test_name,
-                'device': device_name,
-                'status': 'PASSED' if test_passed else 'FAILED',
-                'system_data': status_data,
-                'issues': issues,
-                'duration': time.time() - start_time,
-                'timestamp': datetime.now().isoformat()
-            }
+            result = self._finalize_result(TestResult(
+                test_name=test_name,
+                device=device_name,
+                status='PASSED' if test_passed else 'FAILED',
+                extra={
+                    'system_data': status_data,
+                    'issues': issues
+                }
+            ), start_time)
             
             if not test_passed:
-                for issue in issues:
-                    self.create_defect(device_name, 'performance', issue)
+                self._create_defects_bulk(device_name, 'performance', issues)
             
-            self.test_results.append(result)
-            self.logger.info(f"Status test for {device_name}: {'PASSED' if test_passed else 'FAILED'}")
+            self._record_result(result)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Status test for {device_name}: {'PASSED' if test_passed else 'FAILED'}")
             return result
             
         except Exception as e:
-            result = {
-                'test_name': test_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'duration': time.time() - start_time,
-                'timestamp': datetime.now().isoformat()
-            }
-            self.test_results.append(result)
+            result = self._finalize_result(TestResult(
+                test_name=test_name,
+                device=device_name,
+                status='ERROR',
+                error=str(e)
+            ), start_time)
+            self._record_result(result)
             return result
     
-    def test_interface_status(self, device_name):
+    def test_interface_status(self, device_name, snapshot=None, device=None):
         """Test network interface status and configuration"""
         test_name = f"interface_test_{device_name}"
-        start_time = time.time()
+        start_time = perf_counter()
         
         try:
+            if device is None:
+                device = self.device_configs.get(device_name, {})
+            
             # Get interface data
-            interface_data = self.simulate_rest_call(device_name, '/interfaces')
-            device_config = self.device_configs.get(device_name, {})
-            expected_interfaces = device_config.get('expected_interfaces', 0)
+            if snapshot is not None:
+                interface_data = self._snapshot_section(snapshot, 'interfaces')
+            else:
+                interface_data = self.simulate_rest_call(device_name, '/interfaces', device=device)
+            expected_interfaces = device.get('expected_interfaces', 0)
             
             test_passed = True
             issues = []
@@ -256,111 +503,123 @@ class NetworkDeviceTestFramework:
                     for iface in down_interfaces:
                         issues.append(f"Interface {iface['name']} is {iface['status']}")
             
-            result = {
-                'test_name': test_name,
-                'device': device_name,
-                'status': 'PASSED' if test_passed else 'FAILED',
-                'interface_data': interface_data,
-                'issues': issues,
-                'duration': time.time() - start_time,
-                'timestamp': datetime.now().isoformat()
-            }
+            result = self._finalize_result(TestResult(
+                test_name=test_name,
+                device=device_name,
+                status='PASSED' if test_passed else 'FAILED',
+                extra={
+                    'interface_data': interface_data,
+                    'issues': issues
+                }
+            ), start_time)
             
             if not test_passed:
-                for issue in issues:
-                    self.create_defect(device_name, 'interface', issue)
+                self._create_defects_bulk(device_name, 'interface', issues)
             
-            self.test_results.append(result)
+            self._record_result(result)
             return result
             
         except Exception as e:
-            result = {
-                'test_name': test_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'duration': time.time() - start_time,
-                'timestamp': datetime.now().isoformat()
-            }
-            self.test_results.append(result)
+            result = self._finalize_result(TestResult(
+                test_name=test_name,
+                device=device_name,
+                status='ERROR',
+                error=str(e)
+            ), start_time)
+            self._record_result(result)
             return result
     
-    def test_alarm_monitoring(self, device_name):
+    def test_alarm_monitoring(self, device_name, snapshot=None):
         """Test alarm monitoring and reporting"""
         test_name = f"alarm_test_{device_name}"
-        start_time = time.time()
+        start_time = perf_counter()
         
         try:
             # Get current alarms
-            alarm_data = self.simulate_rest_call(device_name, '/alarms')
+            if snapshot is not None:
+                alarm_data = self._snapshot_section(snapshot, 'alarms')
+            else:
+                alarm_data = self.simulate_rest_call(device_name, '/alarms')
+            active_alarms = alarm_data.get('active_alarms', [])
             
-            result = {
-                'test_name': test_name,
-                'device': device_name,
-                'status': 'PASSED',  # Always pass for monitoring
-                'active_alarms': alarm_data.get('active_alarms', []),
-                'alarm_count': len(alarm_data.get('active_alarms', [])),
-                'duration': time.time() - start_time,
-                'timestamp': datetime.now().isoformat()
-            }
+            result = self._finalize_result(TestResult(
+                test_name=test_name,
+                device=device_name,
+                status='PASSED',  # Always pass for monitoring
+                extra={
+                    'active_alarms': active_alarms,
+                    'alarm_count': len(active_alarms)
+                }
+            ), start_time)
             
             # Log alarms for tracking
-            if alarm_data.get('active_alarms'):
-                for alarm in alarm_data['active_alarms']:
-                    self.logger.warning(f"Active alarm on {device_name}: {alarm['message']}")
+            for alarm in active_alarms:
+                self.logger.warning(f"Active alarm on {device_name}: {alarm['message']}")
             
-            self.test_results.append(result)
+            self._record_result(result)
             return result
             
         except Exception as e:
-            result = {
-                'test_name': test_name,
-                'status': 'ERROR',
-                'error': str(e),
-                'duration': time.time() - start_time,
-                'timestamp': datetime.now().isoformat()
-            }
-            self.test_results.append(result)
+            result = self._finalize_result(TestResult(
+                test_name=test_name,
+                device=device_name,
+                status='ERROR',
+                error=str(e)
+            ), start_time)
+            self._record_result(result)
             return result
     
     def simulate_ping(self, ip_address):
         """Simulate ping test - returns response time in ms"""
-        import random
         # Simulate realistic response times
-        return random.uniform(1.0, 50.0)  # 1-50ms
+        return self._uniform(1.0, 50.0)  # 1-50ms
     
     def simulate_port_check(self, ip_address, port):
         """Simulate port connectivity check"""
-        import random
         # 95% success rate for simulation
-        return random.random() > 0.05
+        return self._random() > 0.05
     
     def create_defect(self, device_name, category, description):
         """Create defect report for tracking issues"""
-        defect_id = f"DEF-{len(self.defects) + 1:04d}"
-        defect = {
-            'defect_id': defect_id,
-            'device': device_name,
-            'category': category,
-            'description': description,
-            'severity': self.determine_severity(category, description),
-            'status': 'OPEN',
-            'created_date': datetime.now().isoformat(),
-            'assigned_to': 'verification_team'
-        }
+        return self._create_defects_bulk(device_name, category, [description])[0]
+    
+    def _create_defects_bulk(self, device_name, category, descriptions):
+        """Create defect reports for several issues found by one test"""
+        if not descriptions:
+            return []
+        created_date = _now_iso()
+        
+        with self._lock:
+            first_id = len(self.defects) + 1
+            defects = [
+                {
+                    'defect_id': f"DEF-{first_id + i:04d}",
+                    'device': device_name,
+                    'category': category,
+                    'description': description,
+                    'severity': self.determine_severity(category, description),
+                    'status': 'OPEN',
+                    'created_date': created_date,
+                    'assigned_to': 'verification_team'
+                }
+                for i, description in enumerate(descriptions)
+            ]
+            self.defects.extend(defects)
         
-        self.defects.append(defect)
-        self.logger.error(f"Defect created: {defect_id} - {description}")
-        return defect
+        summary = "; ".join(f"{d['defect_id']} - {d['description']}" for d in defects)
+        self.logger.error(f"Defect{'s' if len(defects) > 1 else ''} created: {summary}")
+        return defects
     
     def determine_severity(self, category, description):
         """Determine defect severity based on category and description"""
-        if 'connectivity' in category.lower() or 'unreachable' in description.lower():
+        category = category.lower()
+        description = description.lower()
+        if 'connectivity' in category or 'unreachable' in description:
             return 'CRITICAL'
-        elif 'interface' in category.lower() and 'down' in description.lower():
+        elif 'interface' in category and 'down' in description:
             return 'MAJOR'
-        elif 'high' in description.lower() and ('cpu' in description.lower() or 'memory' in description.lower()):
-            return 'MINOR'
         else:
+            # High CPU/memory and everything else are minor
             return 'MINOR'
     
     def run_test_suite(self, device_names=None):
@@ -368,25 +627,77 @@ class NetworkDeviceTestFramework:
         if device_names is None:
             device_names = list(self.device_configs.keys())
         
-        self.logger.info(f"Starting test suite for devices: {device_names}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Starting test suite for devices: {device_names}")
+        if not device_names:
+            return
+        
+        # Tests are I/O-bound, so devices are exercised concurrently
+        batches = [[] for _ in device_names]
+        try:
+            with ThreadPoolExecutor(max_workers=min(32, len(device_names))) as executor:
+                list(executor.map(self._collect_device_results, device_names, batches))
+        finally:
+            # The executor waits for every batch, so finished devices are kept
+            # even when another device's tests raised
+            self._merge_results([result for batch in batches for result in batch])
+    
+    def _collect_device_results(self, device_name, results):
+        """Run a device's tests, buffering its results on the worker thread"""
+        self._thread_local.results = results
+        try:
+            self._run_device_tests(device_name)
+        finally:
+            self._thread_local.results = None
+    
+    async def run_test_suite_async(self, device_names=None):
+        """Run the test suite with all device REST calls issued concurrently"""
+        if httpx is None:
+            raise ImportError("httpx is required for run_test_suite_async")
+        if device_names is None:
+            device_names = list(self.device_configs.keys())
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Starting async test suite for devices: {device_names}")
         
-        for device_name in device_names:
+        devices = [self.device_configs.get(device_name) for device_name in device_names]
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        timeout = httpx.Timeout(5.0, connect=1.0)
+        async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+            snapshots = await asyncio.gather(*(
+                self._fetch_device_snapshot_async(client, device_name, device)
+                for device_name, device in zip(device_names, devices)
+            ))
+        
+        for device_name, device, snapshot in zip(device_names, devices, snapshots):
+            self._run_device_tests(device_name, device=device, snapshot=snapshot)
+    
+    def _run_device_tests(self, device_name, device=None, snapshot=None):
+        """Run all test types against a single device"""
+        if self.logger.isEnabledFor(logging.INFO):
             self.logger.info(f"Testing device: {device_name}")
-            
-            # Run all test types
-            self.test_device_connectivity(device_name)
-            self.test_device_status(device_name)
-            self.test_interface_status(device_name)
-            self.test_alarm_monitoring(device_name)
-            
-            time.sleep(1)  # Brief pause between devices
+        
+        if device is None:
+            device = self.device_configs.get(device_name)
+        self.test_device_connectivity(device_name, device=device)
+        
+        # One round-trip for all REST-backed tests
+        if snapshot is None:
+            snapshot = self._fetch_device_snapshot(device_name, device=device)
+        self.test_device_status(device_name, snapshot=snapshot)
+        self.test_interface_status(device_name, snapshot=snapshot, device=device)
+        self.test_alarm_monitoring(device_name, snapshot=snapshot)
     
     def generate_test_report(self):
         """Generate comprehensive test report"""
-        total_tests = len(self.test_results)
-        passed_tests = len([t for t in self.test_results if t['status'] == 'PASSED'])
-        failed_tests = len([t for t in self.test_results if t['status'] == 'FAILED'])
-        error_tests = len([t for t in self.test_results if t['status'] == 'ERROR'])
+        with self._lock:
+            total_tests = len(self.test_results)
+            if total_tests != sum(self._status_counts.values()):
+                # test_results was edited directly; recount to match it
+                self._status_counts = Counter(result.status for result in self.test_results)
+            passed_tests = self._status_counts['PASSED']
+            failed_tests = self._status_counts['FAILED']
+            error_tests = self._status_counts['ERROR']
         
         report = {
             'test_summary': {
@@ -396,10 +707,10 @@ class NetworkDeviceTestFramework:
                 'errors': error_tests,
                 'pass_rate': f"{(passed_tests/total_tests*100):.1f}%" if total_tests > 0 else "0%"
             },
-            'test_results': self.test_results,
+            'test_results': [result.to_dict() for result in self.test_results],
             'defects_found': len(self.defects),
             'defect_details': self.defects,
-            'report_generated': datetime.now().isoformat()
+            'report_generated': _now_iso()
         }
         
         return report
@@ -407,10 +718,15 @@ class NetworkDeviceTestFramework:
     def save_report_to_file(self, filename='test_report.json'):
         """Save test report to file"""
         report = self.generate_test_report()
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(report, f, separators=(',', ':'))
         
-        self.logger.info(f"Test report saved to {filename}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Test report saved to {filename}")
         return filename
 
 def demonstrate_test_framework():
@@ -444,6 +760,8 @@ def demonstrate_test_framework():
     # Save detailed report
     filename = framework.save_report_to_file()
     print(f"\nDetailed report saved to: {filename}")
+    
+    framework.close()
 
 if __name__ == "__main__":
     demonstrate_test_framework()
\ No newline at end of file